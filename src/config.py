@@ -6,45 +6,54 @@ import sys
 from urllib.parse import urlparse
 
 
+_TRUTHY = frozenset(("true", "1", "yes"))
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARN", "WARNING", "ERROR"))
+
+
+def _as_bool(env: dict[str, str], key: str, default: str) -> bool:
+    """Read a boolean flag from the environment snapshot."""
+    return env.get(key, default).lower() in _TRUTHY
+
+
+def _as_int(env: dict[str, str], key: str, default: str) -> int:
+    """Read an integer value from the environment snapshot."""
+    return int(env.get(key, default))
+
+
 class Config:
     """Application configuration from environment variables."""
 
     def __init__(self):
+        env = dict(os.environ)
+
         # Required
-        self.gluetun_url = os.environ.get("GLUETUN_URL", "").rstrip("/")
-        self.qbittorrent_url = os.environ.get("QBITTORRENT_URL", "").rstrip("/")
+        self.gluetun_url = env.get("GLUETUN_URL", "").rstrip("/")
+        self.qbittorrent_url = env.get("QBITTORRENT_URL", "").rstrip("/")
 
         # Gluetun authentication
-        self.gluetun_api_key = os.environ.get("GLUETUN_API_KEY")
-        self.gluetun_username = os.environ.get("GLUETUN_USERNAME")
-        self.gluetun_password = os.environ.get("GLUETUN_PASSWORD")
+        self.gluetun_api_key = env.get("GLUETUN_API_KEY")
+        self.gluetun_username = env.get("GLUETUN_USERNAME")
+        self.gluetun_password = env.get("GLUETUN_PASSWORD")
 
         # qBittorrent authentication
-        self.qbittorrent_username = os.environ.get("QBITTORRENT_USERNAME")
-        self.qbittorrent_password = os.environ.get("QBITTORRENT_PASSWORD")
-        self.qbittorrent_verify_ssl = os.environ.get(
-            "QBITTORRENT_VERIFY_SSL", "true"
-        ).lower() in ("true", "1", "yes")
+        self.qbittorrent_username = env.get("QBITTORRENT_USERNAME")
+        self.qbittorrent_password = env.get("QBITTORRENT_PASSWORD")
+        self.qbittorrent_verify_ssl = _as_bool(env, "QBITTORRENT_VERIFY_SSL", "true")
 
         # Timing
-        self.startup_check_delay = int(os.environ.get("STARTUP_CHECK_DELAY", "5"))
-        self.startup_check_interval = int(
-            os.environ.get("STARTUP_CHECK_INTERVAL", "5")
-        )
-        self.startup_max_attempts = int(os.environ.get("STARTUP_MAX_ATTEMPTS", "60"))
-        self.poll_interval = int(os.environ.get("POLL_INTERVAL", "30"))
-        self.verify_delay = int(os.environ.get("VERIFY_DELAY", "2"))
-        self.verify_max_attempts = int(os.environ.get("VERIFY_MAX_ATTEMPTS", "3"))
-        self.request_timeout = int(os.environ.get("REQUEST_TIMEOUT", "10"))
+        self.startup_check_delay = _as_int(env, "STARTUP_CHECK_DELAY", "5")
+        self.startup_check_interval = _as_int(env, "STARTUP_CHECK_INTERVAL", "5")
+        self.startup_max_attempts = _as_int(env, "STARTUP_MAX_ATTEMPTS", "60")
+        self.poll_interval = _as_int(env, "POLL_INTERVAL", "30")
+        self.poll_max_interval = _as_int(env, "POLL_MAX_INTERVAL", "300")
+        self.verify_delay = _as_int(env, "VERIFY_DELAY", "2")
+        self.verify_max_attempts = _as_int(env, "VERIFY_MAX_ATTEMPTS", "3")
+        self.request_timeout = _as_int(env, "REQUEST_TIMEOUT", "10")
 
         # Logging and health
-        self.log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-        self.health_enabled = os.environ.get("HEALTH_ENABLED", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
-        self.health_port = int(os.environ.get("HEALTH_PORT", "8081"))
+        self.log_level = env.get("LOG_LEVEL", "INFO").upper()
+        self.health_enabled = _as_bool(env, "HEALTH_ENABLED", "true")
+        self.health_port = _as_int(env, "HEALTH_PORT", "8081")
 
     def validate(self) -> list[str]:
         """Validate configuration, returning list of errors."""
@@ -60,13 +69,20 @@ class Config:
         elif not self._is_valid_url(self.qbittorrent_url):
             errors.append(f"QBITTORRENT_URL is not a valid URL: {self.qbittorrent_url}")
 
-        if self.log_level not in ("DEBUG", "INFO", "WARN", "WARNING", "ERROR"):
+        if self.log_level not in _VALID_LOG_LEVELS:
             errors.append(f"LOG_LEVEL must be DEBUG, INFO, WARN, or ERROR: {self.log_level}")
 
         return errors
 
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is valid."""
+        # Cheap checks first; only well-formed candidates reach urlparse
+        if not url[:8].lower().startswith(("http://", "https://")):
+            return False
+        netloc = url[url.index("://") + 3 :].split("/", 1)[0]
+        if not netloc or any(c.isspace() for c in netloc):
+            return False
+
         try:
             result = urlparse(url)
             return all([result.scheme in ("http", "https"), result.netloc])
@@ -75,29 +91,45 @@ class Config:
 
     def log_config(self, logger: logging.Logger) -> None:
         """Log configuration values, masking sensitive data."""
-        logger.info(f"Gluetun URL: {self.gluetun_url}")
-        logger.info(f"qBittorrent URL: {self.qbittorrent_url}")
+        logger.info("Gluetun URL: %s", self.gluetun_url)
+        logger.info("qBittorrent URL: %s", self.qbittorrent_url)
 
         if self.gluetun_api_key:
             logger.info("Gluetun auth: API key")
         elif self.gluetun_username:
-            logger.info(f"Gluetun auth: Basic auth (user: {self.gluetun_username})")
+            logger.info("Gluetun auth: Basic auth (user: %s)", self.gluetun_username)
         else:
             logger.info("Gluetun auth: None")
 
         if self.qbittorrent_username:
-            logger.info(f"qBittorrent auth: Enabled (user: {self.qbittorrent_username})")
+            logger.info("qBittorrent auth: Enabled (user: %s)", self.qbittorrent_username)
         else:
             logger.info("qBittorrent auth: Disabled")
 
-        logger.info(f"Poll interval: {self.poll_interval}s")
-        logger.info(f"Startup check delay: {self.startup_check_delay}s")
-        logger.info(f"Startup check interval: {self.startup_check_interval}s")
-        logger.info(f"Startup max attempts: {self.startup_max_attempts}")
-        logger.info(f"Request timeout: {self.request_timeout}s")
-        logger.info(f"Health endpoint: {'enabled' if self.health_enabled else 'disabled'}")
+        logger.info("Poll interval: %ss", self.poll_interval)
+        logger.info("Poll max interval: %ss", self.poll_max_interval)
+        logger.info("Startup check delay: %ss", self.startup_check_delay)
+        logger.info("Startup check interval: %ss", self.startup_check_interval)
+        logger.info("Startup max attempts: %s", self.startup_max_attempts)
+        logger.info("Request timeout: %ss", self.request_timeout)
+        logger.info(
+            "Health endpoint: %s", "enabled" if self.health_enabled else "disabled"
+        )
         if self.health_enabled:
-            logger.info(f"Health port: {self.health_port}")
+            logger.info("Health port: %s", self.health_port)
+
+
+class LazyBody:
+    """Log argument that decodes a response body only when formatted."""
+
+    __slots__ = ("_response", "_limit")
+
+    def __init__(self, response, limit: int = 500):
+        self._response = response
+        self._limit = limit
+
+    def __str__(self) -> str:
+        return self._response.text[: self._limit]
 
 
 def setup_logging(level: str) -> logging.Logger:
@@ -4,11 +4,13 @@ import logging
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import Config
+from .config import Config, LazyBody
+from .jsonutil import json_loads
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GluetunResult:
     """Result from Gluetun API call."""
 
@@ -25,6 +27,12 @@ class GluetunClient:
         self.config = config
         self.logger = logger
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        self._port_url = f"{config.gluetun_url}/v1/portforward"
+        self._timeout = config.request_timeout
         self._setup_auth()
 
     def _setup_auth(self) -> None:
@@ -39,14 +47,14 @@ class GluetunClient:
 
     def get_forwarded_port(self) -> GluetunResult:
         """Get the forwarded port from Gluetun."""
-        url = f"{self.config.gluetun_url}/v1/portforward"
-
-        self.logger.debug(f"GET {url}")
+        self.logger.debug("GET %s", self._port_url)
 
         try:
-            response = self._session.get(url, timeout=self.config.request_timeout)
+            response = self._session.get(self._port_url, timeout=self._timeout)
 
-            self.logger.debug(f"Response: {response.status_code} {response.text}")
+            self.logger.debug(
+                "Response: %s %s", response.status_code, LazyBody(response)
+            )
 
             if response.status_code == 401:
                 return GluetunResult(
@@ -83,7 +91,7 @@ class GluetunClient:
                 )
 
             try:
-                data = response.json()
+                data = json_loads(response.content)
                 port = data.get("port")
 
                 if port is None or port == 0:
@@ -1,48 +1,60 @@
 """Health check HTTP server."""
 
-import json
 import logging
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .jsonutil import json_dumps
+
+# The healthy response never changes, so serialize it once
+_HEALTHY_BODY = json_dumps({"status": "healthy"})
+_HEALTHY_LENGTH = str(len(_HEALTHY_BODY))
 
 
 class HealthState:
-    """Thread-safe health state container."""
+    """Thread-safe health state container.
+
+    State is held in a single immutable tuple that writers replace as a whole,
+    so readers see a consistent snapshot without taking the lock.
+    """
 
     def __init__(self):
         self._lock = threading.Lock()
-        self._healthy = False
-        self._reason = "Starting up"
-        self._gluetun_ok = False
-        self._qbittorrent_ok = False
+        # (healthy, reason, gluetun_ok, qbittorrent_ok)
+        self._snapshot: tuple[bool, str, bool, bool] = (
+            False,
+            "Starting up",
+            False,
+            False,
+        )
 
     def set_healthy(self, healthy: bool, reason: str = "") -> None:
         """Update health state."""
         with self._lock:
-            self._healthy = healthy
-            self._reason = reason
+            _, _, gluetun_ok, qbittorrent_ok = self._snapshot
+            self._snapshot = (healthy, reason, gluetun_ok, qbittorrent_ok)
 
     def set_service_status(self, gluetun_ok: bool, qbittorrent_ok: bool) -> None:
         """Update individual service status."""
+        if gluetun_ok and qbittorrent_ok:
+            healthy = True
+            reason = ""
+        else:
+            healthy = False
+            reasons = []
+            if not gluetun_ok:
+                reasons.append("Gluetun unreachable")
+            if not qbittorrent_ok:
+                reasons.append("qBittorrent unreachable")
+            reason = ", ".join(reasons)
+
         with self._lock:
-            self._gluetun_ok = gluetun_ok
-            self._qbittorrent_ok = qbittorrent_ok
-            if gluetun_ok and qbittorrent_ok:
-                self._healthy = True
-                self._reason = ""
-            else:
-                self._healthy = False
-                reasons = []
-                if not gluetun_ok:
-                    reasons.append("Gluetun unreachable")
-                if not qbittorrent_ok:
-                    reasons.append("qBittorrent unreachable")
-                self._reason = ", ".join(reasons)
+            self._snapshot = (healthy, reason, gluetun_ok, qbittorrent_ok)
 
     def get_status(self) -> tuple[bool, str]:
         """Get current health status."""
-        with self._lock:
-            return self._healthy, self._reason
+        healthy, reason, _, _ = self._snapshot
+        return healthy, reason
 
 
 def create_health_handler(state: HealthState, logger: logging.Logger):
@@ -53,7 +65,12 @@ def create_health_handler(state: HealthState, logger: logging.Logger):
 
         def log_message(self, format: str, *args) -> None:
             """Override to use our logger."""
-            logger.debug(f"Health check: {args[0]}")
+            logger.debug("Health check: %s", args[0])
+
+        def log_request(self, code="-", size="-") -> None:
+            """Skip building the access log line unless debug is enabled."""
+            if logger.isEnabledFor(logging.DEBUG):
+                super().log_request(code, size)
 
         def do_GET(self) -> None:
             """Handle GET requests."""
@@ -62,14 +79,17 @@ def create_health_handler(state: HealthState, logger: logging.Logger):
 
                 if healthy:
                     self.send_response(200)
-                    response = {"status": "healthy"}
+                    body = _HEALTHY_BODY
+                    length = _HEALTHY_LENGTH
                 else:
                     self.send_response(503)
-                    response = {"status": "unhealthy", "reason": reason}
+                    body = json_dumps({"status": "unhealthy", "reason": reason})
+                    length = str(len(body))
 
                 self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", length)
                 self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(body)
             else:
                 self.send_response(404)
                 self.end_headers()
@@ -77,6 +97,14 @@ def create_health_handler(state: HealthState, logger: logging.Logger):
     return HealthHandler
 
 
+class _HealthHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server tuned for bursts of orchestrator probes."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 16
+
+
 class HealthServer:
     """Health check HTTP server running in a background thread."""
 
@@ -84,18 +112,18 @@ class HealthServer:
         self.port = port
         self.state = state
         self.logger = logger
-        self._server: HTTPServer | None = None
+        self._server: _HealthHTTPServer | None = None
         self._thread: threading.Thread | None = None
 
     def start(self) -> None:
         """Start the health server in a background thread."""
         handler = create_health_handler(self.state, self.logger)
-        self._server = HTTPServer(("0.0.0.0", self.port), handler)
+        self._server = _HealthHTTPServer(("0.0.0.0", self.port), handler)
 
         self._thread = threading.Thread(target=self._serve, daemon=True)
         self._thread.start()
 
-        self.logger.info(f"Health server started on port {self.port}")
+        self.logger.info("Health server started on port %s", self.port)
 
     def _serve(self) -> None:
         """Serve requests until shutdown."""
@@ -106,4 +134,9 @@ class HealthServer:
         """Stop the health server."""
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            if self._thread:
+                self._thread.join(timeout=2)
+                self._thread = None
             self.logger.debug("Health server stopped")
@@ -0,0 +1,29 @@
+"""JSON helpers, using orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return orjson.dumps(obj)
+
+    def json_loads(data: bytes | str) -> Any:
+        """Deserialize JSON bytes or text."""
+        return orjson.loads(data)
+
+else:
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return json.dumps(obj).encode()
+
+    def json_loads(data: bytes | str) -> Any:
+        """Deserialize JSON bytes or text."""
+        return json.loads(data)
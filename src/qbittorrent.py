@@ -1,16 +1,21 @@
 """qBittorrent Web API client."""
 
-import json
 import logging
+import re
 from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import Config
+from .config import Config, LazyBody
+from .jsonutil import json_dumps, json_loads
 
+# Matches the listen_port field without parsing the full preferences document
+_LISTEN_PORT_RE = re.compile(rb'"listen_port"\s*:\s*(\d+)')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class QBittorrentResult:
     """Result from qBittorrent API call."""
 
@@ -27,8 +32,20 @@ class QBittorrentClient:
         self.config = config
         self.logger = logger
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        self._session.headers["Accept"] = "application/json"
         self._authenticated = False
 
+        base_url = config.qbittorrent_url
+        self._login_url = f"{base_url}/api/v2/auth/login"
+        self._prefs_url = f"{base_url}/api/v2/app/preferences"
+        self._setprefs_url = f"{base_url}/api/v2/app/setPreferences"
+        self._timeout = config.request_timeout
+        self._verify = config.qbittorrent_verify_ssl
+
     def _login(self) -> QBittorrentResult:
         """Authenticate with qBittorrent if credentials are configured."""
         if not self.config.qbittorrent_username:
@@ -38,22 +55,22 @@ class QBittorrentClient:
         if self._authenticated:
             return QBittorrentResult(success=True)
 
-        url = f"{self.config.qbittorrent_url}/api/v2/auth/login"
-
-        self.logger.debug(f"POST {url} (login)")
+        self.logger.debug("POST %s (login)", self._login_url)
 
         try:
             response = self._session.post(
-                url,
+                self._login_url,
                 data={
                     "username": self.config.qbittorrent_username,
                     "password": self.config.qbittorrent_password,
                 },
-                timeout=self.config.request_timeout,
-                verify=self.config.qbittorrent_verify_ssl,
+                timeout=self._timeout,
+                verify=self._verify,
             )
 
-            self.logger.debug(f"Response: {response.status_code} {response.text}")
+            self.logger.debug(
+                "Response: %s %s", response.status_code, LazyBody(response)
+            )
 
             if response.status_code == 403:
                 return QBittorrentResult(
@@ -91,7 +108,7 @@ class QBittorrentClient:
     def _request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         retry_auth: bool = True,
         **kwargs: Any,
     ) -> tuple[requests.Response | None, QBittorrentResult | None]:
@@ -100,43 +117,49 @@ class QBittorrentClient:
 
         Returns (response, None) on success, or (None, error_result) on failure.
         """
-        login_result = self._login()
-        if not login_result.success:
-            return None, login_result
+        attempts = 2 if retry_auth else 1
+
+        for attempt in range(1, attempts + 1):
+            login_result = self._login()
+            if not login_result.success:
+                return None, login_result
+
+            self.logger.debug("%s %s", method.upper(), url)
+
+            try:
+                response = self._session.request(
+                    method,
+                    url,
+                    timeout=self._timeout,
+                    verify=self._verify,
+                    **kwargs,
+                )
 
-        url = f"{self.config.qbittorrent_url}{endpoint}"
-        self.logger.debug(f"{method.upper()} {url}")
+            except requests.exceptions.Timeout:
+                return None, QBittorrentResult(success=False, error="Request timed out")
 
-        try:
-            response = self._session.request(
-                method,
-                url,
-                timeout=self.config.request_timeout,
-                verify=self.config.qbittorrent_verify_ssl,
-                **kwargs,
-            )
+            except requests.exceptions.ConnectionError as e:
+                return None, QBittorrentResult(
+                    success=False, error=f"Connection error: {e}"
+                )
 
-            self.logger.debug(f"Response: {response.status_code}")
+            except requests.exceptions.RequestException as e:
+                return None, QBittorrentResult(
+                    success=False, error=f"Request failed: {e}"
+                )
 
-            if response.status_code == 403 and retry_auth:
+            self.logger.debug("Response: %s", response.status_code)
+
+            if response.status_code == 403 and attempt < attempts:
                 self.logger.debug("Got 403, retrying with fresh login")
                 self._authenticated = False
-                return self._request(method, endpoint, retry_auth=False, **kwargs)
+                continue
 
             return response, None
 
-        except requests.exceptions.Timeout:
-            return None, QBittorrentResult(success=False, error="Request timed out")
-
-        except requests.exceptions.ConnectionError as e:
-            return None, QBittorrentResult(success=False, error=f"Connection error: {e}")
-
-        except requests.exceptions.RequestException as e:
-            return None, QBittorrentResult(success=False, error=f"Request failed: {e}")
-
     def get_listen_port(self) -> QBittorrentResult:
         """Get the current listening port from qBittorrent."""
-        response, error = self._request("GET", "/api/v2/app/preferences")
+        response, error = self._request("GET", self._prefs_url)
 
         if error:
             return error
@@ -147,8 +170,14 @@ class QBittorrentClient:
                 error=f"Failed to get preferences: {response.status_code}",
             )
 
+        match = _LISTEN_PORT_RE.search(response.content)
+        if match:
+            port = int(match.group(1))
+            self.logger.debug("Current listen port: %s", port)
+            return QBittorrentResult(success=True, port=port)
+
         try:
-            data = response.json()
+            data = json_loads(response.content)
             port = data.get("listen_port")
 
             if port is None:
@@ -157,7 +186,7 @@ class QBittorrentClient:
                     error="listen_port not in response",
                 )
 
-            self.logger.debug(f"Current listen port: {port}")
+            self.logger.debug("Current listen port: %s", port)
             return QBittorrentResult(success=True, port=int(port))
 
         except (ValueError, KeyError) as e:
@@ -168,12 +197,12 @@ class QBittorrentClient:
 
     def set_listen_port(self, port: int) -> QBittorrentResult:
         """Set the listening port in qBittorrent."""
-        self.logger.debug(f"Setting listen_port={port}")
+        self.logger.debug("Setting listen_port=%s", port)
 
         response, error = self._request(
             "POST",
-            "/api/v2/app/setPreferences",
-            data={"json": json.dumps({"listen_port": port})},
+            self._setprefs_url,
+            data={"json": json_dumps({"listen_port": port})},
         )
 
         if error:
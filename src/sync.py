@@ -1,14 +1,25 @@
 """Main synchronization logic and entry point."""
 
 import logging
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .config import Config, load_config, setup_logging
 from .gluetun import GluetunClient
 from .health import HealthServer, HealthState
 from .qbittorrent import QBittorrentClient
 
+# Double the poll interval after this many consecutive unchanged cycles
+STABLE_CYCLES_PER_BACKOFF = 5
+# Maximum number of doublings (16x the base poll interval)
+MAX_BACKOFF_STEPS = 4
+# Re-check qBittorrent at least this often (seconds) to catch out-of-band changes
+REVERIFY_INTERVAL = 600
+# First wait (seconds) before verifying a port update; doubles up to VERIFY_DELAY
+INITIAL_VERIFY_DELAY = 0.1
+
 
 class PortSync:
     """Main port synchronization orchestrator."""
@@ -26,63 +37,58 @@ class PortSync:
         self.gluetun = gluetun
         self.qbittorrent = qbittorrent
         self.health_state = health_state
+        self._last_synced_port: int | None = None
+        self._last_verify_time = 0.0
+        self._stable_cycles = 0
 
     def wait_for_services(self) -> bool:
         """Wait for both services to be ready. Returns True if successful."""
         self.logger.info("Waiting for services to be ready...")
 
-        gluetun_ready = False
-        qbittorrent_ready = False
-
-        for attempt in range(1, self.config.startup_max_attempts + 1):
-            # Check Gluetun
-            if not gluetun_ready:
-                self.logger.info(
-                    f"Checking Gluetun... (attempt {attempt}/{self.config.startup_max_attempts})"
-                )
-                result = self.gluetun.check_ready()
-
-                if result.is_auth_error:
-                    self.logger.error(f"Gluetun authentication failed: {result.error}")
-                    return False
-
-                if result.success:
-                    self.logger.info("Gluetun is ready")
-                    gluetun_ready = True
-                else:
-                    self.logger.debug(f"Gluetun not ready: {result.error}")
-
-            # Check qBittorrent
-            if not qbittorrent_ready:
-                self.logger.info(
-                    f"Checking qBittorrent... (attempt {attempt}/{self.config.startup_max_attempts})"
-                )
-                result = self.qbittorrent.check_ready()
-
-                if result.is_auth_error:
-                    self.logger.error(
-                        f"qBittorrent authentication failed: {result.error}"
+        pending = {"Gluetun": self.gluetun, "qBittorrent": self.qbittorrent}
+
+        # Probe services concurrently so an attempt takes as long as the
+        # slower check rather than the sum of both
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for attempt in range(1, self.config.startup_max_attempts + 1):
+                futures = {}
+                for name, client in pending.items():
+                    self.logger.info(
+                        "Checking %s... (attempt %s/%s)",
+                        name,
+                        attempt,
+                        self.config.startup_max_attempts,
                     )
-                    return False
-
-                if result.success:
-                    self.logger.info("qBittorrent is ready")
-                    qbittorrent_ready = True
-                else:
-                    self.logger.debug(f"qBittorrent not ready: {result.error}")
-
-            # Both ready?
-            if gluetun_ready and qbittorrent_ready:
-                self.logger.info("Both services ready")
-                self.health_state.set_service_status(True, True)
-                return True
-
-            # Wait before next attempt
-            if attempt < self.config.startup_max_attempts:
-                time.sleep(self.config.startup_check_interval)
+                    futures[executor.submit(client.check_ready)] = name
+
+                for future in as_completed(futures):
+                    name = futures[future]
+                    result = future.result()
+
+                    if result.is_auth_error:
+                        self.logger.error(
+                            "%s authentication failed: %s", name, result.error
+                        )
+                        return False
+
+                    if result.success:
+                        self.logger.info("%s is ready", name)
+                        del pending[name]
+                    else:
+                        self.logger.debug("%s not ready: %s", name, result.error)
+
+                # Both ready?
+                if not pending:
+                    self.logger.info("Both services ready")
+                    self.health_state.set_service_status(True, True)
+                    return True
+
+                # Wait before next attempt
+                if attempt < self.config.startup_max_attempts:
+                    time.sleep(self.config.startup_check_interval)
 
         self.logger.error(
-            f"Services not ready after {self.config.startup_max_attempts} attempts"
+            "Services not ready after %s attempts", self.config.startup_max_attempts
         )
         return False
 
@@ -91,16 +97,20 @@ class PortSync:
         Perform a single port sync cycle.
         Returns True if sync was successful (or no update needed).
         """
+        # Any outcome other than an unchanged port resets the backoff
+        stable_cycles = self._stable_cycles
+        self._stable_cycles = 0
+
         # Get forwarded port from Gluetun
         gluetun_result = self.gluetun.get_forwarded_port()
 
         if gluetun_result.is_auth_error:
-            self.logger.error(f"Gluetun auth error: {gluetun_result.error}")
+            self.logger.error("Gluetun auth error: %s", gluetun_result.error)
             self.health_state.set_healthy(False, f"Gluetun auth error: {gluetun_result.error}")
             return False
 
         if not gluetun_result.success:
-            self.logger.warning(f"Failed to get Gluetun port: {gluetun_result.error}")
+            self.logger.warning("Failed to get Gluetun port: %s", gluetun_result.error)
             self.health_state.set_service_status(False, True)
             return False
 
@@ -111,16 +121,26 @@ class PortSync:
 
         gluetun_port = gluetun_result.port
 
+        # Skip querying qBittorrent if this port was synced and recently verified
+        if (
+            gluetun_port == self._last_synced_port
+            and time.monotonic() - self._last_verify_time < REVERIFY_INTERVAL
+        ):
+            self.logger.info("Port unchanged (%s)", gluetun_port)
+            self.health_state.set_service_status(True, True)
+            self._stable_cycles = stable_cycles + 1
+            return True
+
         # Get current qBittorrent port
         qbt_result = self.qbittorrent.get_listen_port()
 
         if qbt_result.is_auth_error:
-            self.logger.error(f"qBittorrent auth error: {qbt_result.error}")
+            self.logger.error("qBittorrent auth error: %s", qbt_result.error)
             self.health_state.set_healthy(False, f"qBittorrent auth error: {qbt_result.error}")
             return False
 
         if not qbt_result.success:
-            self.logger.warning(f"Failed to get qBittorrent port: {qbt_result.error}")
+            self.logger.warning("Failed to get qBittorrent port: %s", qbt_result.error)
             self.health_state.set_service_status(True, False)
             return False
 
@@ -129,59 +149,107 @@ class PortSync:
 
         # Compare and update if needed
         if current_port == gluetun_port:
-            self.logger.info(f"Port unchanged ({current_port})")
+            self.logger.info("Port unchanged (%s)", current_port)
+            self._last_synced_port = gluetun_port
+            self._last_verify_time = time.monotonic()
+            self._stable_cycles = stable_cycles + 1
             return True
 
         self.logger.info(
-            f"Port changed: {current_port} -> {gluetun_port}, updating qBittorrent"
+            "Port changed: %s -> %s, updating qBittorrent", current_port, gluetun_port
         )
 
-        # Update port
+        # Update port; forget the cached port until the new one is verified
+        self._last_synced_port = None
         update_result = self.qbittorrent.set_listen_port(gluetun_port)
 
         if not update_result.success:
-            self.logger.error(f"Failed to update port: {update_result.error}")
+            self.logger.error("Failed to update port: %s", update_result.error)
             # Continue to verification anyway
 
         # Verify update with retries
         for attempt in range(1, self.config.verify_max_attempts + 1):
-            time.sleep(self.config.verify_delay)
+            time.sleep(
+                min(INITIAL_VERIFY_DELAY * 2 ** (attempt - 1), self.config.verify_delay)
+            )
 
             verify_result = self.qbittorrent.get_listen_port()
 
             if not verify_result.success:
                 self.logger.warning(
-                    f"Failed to verify port update (attempt {attempt}/{self.config.verify_max_attempts}): {verify_result.error}"
+                    "Failed to verify port update (attempt %s/%s): %s",
+                    attempt,
+                    self.config.verify_max_attempts,
+                    verify_result.error,
                 )
                 continue
 
             if verify_result.port == gluetun_port:
-                self.logger.info(f"Port updated successfully to {gluetun_port}")
+                self.logger.info("Port updated successfully to %s", gluetun_port)
+                self._last_synced_port = gluetun_port
+                self._last_verify_time = time.monotonic()
                 return True
 
             self.logger.debug(
-                f"Port not yet updated (attempt {attempt}/{self.config.verify_max_attempts}): expected {gluetun_port}, got {verify_result.port}"
+                "Port not yet updated (attempt %s/%s): expected %s, got %s",
+                attempt,
+                self.config.verify_max_attempts,
+                gluetun_port,
+                verify_result.port,
             )
 
         # All attempts exhausted
         self.logger.warning(
-            f"Port verification failed after {self.config.verify_max_attempts} attempts: expected {gluetun_port}, got {verify_result.port}"
+            "Port verification failed after %s attempts: expected %s, got %s",
+            self.config.verify_max_attempts,
+            gluetun_port,
+            verify_result.port,
         )
         return False
 
+    def next_poll_interval(self) -> int:
+        """Return the poll interval, backing off while the port is stable."""
+        base = self.config.poll_interval
+        steps = min(self._stable_cycles // STABLE_CYCLES_PER_BACKOFF, MAX_BACKOFF_STEPS)
+        return max(base, min(base * 2**steps, self.config.poll_max_interval))
+
     def run(self) -> None:
         """Run the main sync loop."""
         self.logger.info("Starting port sync loop")
 
+        # Bind loop invariants once
+        sync_port = self.sync_port
+        next_poll_interval = self.next_poll_interval
+        set_healthy = self.health_state.set_healthy
+        log_debug = self.logger.debug
+        log_error = self.logger.error
+        sleep = time.sleep
+
         while True:
             try:
-                self.sync_port()
+                sync_port()
             except Exception as e:
-                self.logger.error(f"Unexpected error in sync loop: {e}")
-                self.health_state.set_healthy(False, str(e))
+                log_error("Unexpected error in sync loop: %s", e)
+                set_healthy(False, str(e))
+
+            interval = next_poll_interval()
+            log_debug("Sleeping for %ss", interval)
+            sleep(interval)
 
-            self.logger.debug(f"Sleeping for {self.config.poll_interval}s")
-            time.sleep(self.config.poll_interval)
+
+def install_signal_handlers(
+    logger: logging.Logger, health_server: HealthServer | None
+) -> None:
+    """Stop the health server and exit cleanly on SIGTERM/SIGINT."""
+
+    def handle_signal(signum: int, frame) -> None:
+        logger.info("Received %s, shutting down", signal.Signals(signum).name)
+        if health_server:
+            health_server.stop()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
 
 
 def main() -> None:
@@ -197,11 +265,14 @@ def main() -> None:
 
     # Initialize health state and server
     health_state = HealthState()
+    health_server = None
 
     if config.health_enabled:
         health_server = HealthServer(config.health_port, health_state, logger)
         health_server.start()
 
+    install_signal_handlers(logger, health_server)
+
     # Initialize clients
     gluetun = GluetunClient(config, logger)
     qbittorrent = QBittorrentClient(config, logger)
@@ -211,7 +282,7 @@ def main() -> None:
 
     # Initial delay before startup checks
     if config.startup_check_delay > 0:
-        logger.info(f"Waiting {config.startup_check_delay}s before startup checks...")
+        logger.info("Waiting %ss before startup checks...", config.startup_check_delay)
         time.sleep(config.startup_check_delay)
 
     # Wait for services